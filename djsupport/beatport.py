@@ -11,6 +11,9 @@ BEATPORT_CHART_URL_PREFIX = "beatport.com/chart/"
 BEATPORT_CHART_PATTERN = re.compile(
     r"^https://(www\.)?beatport\.com/chart/[\w-]+/\d+/?$"
 )
+NEXT_DATA_PATTERN = re.compile(
+    r'<script\s+id="__NEXT_DATA__"\s*[^>]*>(.*?)</script>', re.DOTALL,
+)
 USER_AGENT = "Mozilla/5.0 (compatible; djsupport/0.5.0)"
 REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds
 MAX_RESPONSE_SIZE = 5 * 1024 * 1024  # 5 MB
@@ -78,11 +81,7 @@ def fetch_chart(url: str) -> tuple[str, str, list[Track]]:
         )
 
     # Extract __NEXT_DATA__ JSON via regex (no BeautifulSoup needed)
-    match = re.search(
-        r'<script\s+id="__NEXT_DATA__"\s*[^>]*>(.*?)</script>',
-        html,
-        re.DOTALL,
-    )
+    match = NEXT_DATA_PATTERN.search(html)
     if not match:
         # Detect anti-bot challenge page
         if "/human-test/" in html or "findProof" in html:
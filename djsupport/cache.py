@@ -1,8 +1,9 @@
 """Persistent match cache with auto-checkpoint and retry logic."""
 
 import json
+import os
 from hashlib import sha256
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -38,6 +39,11 @@ class CacheEntry:
         self.score_reasons = tuple(self.score_reasons)
 
 
+# CacheEntry holds only scalars and a tuple of strings, so a shallow
+# field read serializes identically to asdict() without its deep copy.
+_ENTRY_FIELDS = tuple(field.name for field in fields(CacheEntry))
+
+
 class MatchCache:
     def __init__(self, path: str = DEFAULT_CACHE_PATH):
         self.path = Path(path)
@@ -104,30 +110,48 @@ class MatchCache:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         data = {
             "version": CACHE_VERSION,
-            "entries": {k: asdict(v) for k, v in self.entries.items()},
+            "entries": {
+                k: {name: getattr(v, name) for name in _ENTRY_FIELDS}
+                for k, v in self.entries.items()
+            },
             "local_regressions": self.local_regressions,
             "approval_conflicts": self.approval_conflicts,
             "fingerprint_observations": self.fingerprint_observations,
             "fingerprint_associations": self.fingerprint_associations,
         }
-        self.path.write_text(json.dumps(data, indent=2))
+        temporary = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        temporary.write_text(json.dumps(data, indent=2))
+        os.replace(temporary, self.path)
         self._dirty_count = 0
         self._durable_seen = True
 
-    def cache_key(self, artist: str, title: str, source_duration: int = 0) -> str:
-        identity = f"{_normalize(artist)}||{_normalize(title)}"
+    def save_if_dirty(self) -> None:
+        """Write cache to disk only if it changed since the last save."""
+        if self._dirty_count or not self.path.exists():
+            self.save()
+
+    @staticmethod
+    def _identity(artist: str, title: str) -> str:
+        return f"{_normalize(artist)}||{_normalize(title)}"
+
+    @staticmethod
+    def _duration_key(identity: str, source_duration: int) -> str:
         return f"{identity}||{source_duration}s" if source_duration > 0 else identity
 
+    def cache_key(self, artist: str, title: str, source_duration: int = 0) -> str:
+        return self._duration_key(self._identity(artist, title), source_duration)
+
     def lookup(
         self, artist: str, title: str, threshold: int, source_duration: int = 0,
     ) -> CacheEntry | None:
         """Return cached entry if valid for this threshold, else None."""
-        key = self.cache_key(artist, title, source_duration)
-        entry = self.entries.get(key)
+        # Normalize once; every key probed below derives from the same identity.
+        identity = self._identity(artist, title)
+        entry = self.entries.get(self._duration_key(identity, source_duration))
         if entry is None and source_duration > 0:
-            entry = self.entries.get(self.cache_key(artist, title))
+            entry = self.entries.get(identity)
         if source_duration == 0:
-            identity_prefix = f"{self.cache_key(artist, title)}||"
+            identity_prefix = f"{identity}||"
             approved = [
                 candidate for candidate_key, candidate in self.entries.items()
                 if candidate_key.startswith(identity_prefix)
@@ -202,9 +226,10 @@ class MatchCache:
         source_duration: int = 0,
     ) -> dict | None:
         """Mark retained matching knowledge as explicitly approved or rejected."""
-        key = self.cache_key(artist, title, source_duration)
+        identity = self._identity(artist, title)
+        key = self._duration_key(identity, source_duration)
         if source_duration > 0:
-            self.entries.pop(self.cache_key(artist, title), None)
+            self.entries.pop(identity, None)
         entry = self.entries.get(key)
         if (
             status == "approved"
@@ -272,9 +297,10 @@ class MatchCache:
         self, artist: str, title: str, source_duration: int = 0,
     ) -> None:
         """Remove authoritative knowledge after an explicit user decision."""
-        self.entries.pop(self.cache_key(artist, title, source_duration), None)
+        identity = self._identity(artist, title)
+        self.entries.pop(self._duration_key(identity, source_duration), None)
         if source_duration > 0:
-            self.entries.pop(self.cache_key(artist, title), None)
+            self.entries.pop(identity, None)
         self._dirty_count += 1
 
     def retain_fingerprint_observation(
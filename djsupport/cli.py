@@ -17,7 +17,12 @@ from djsupport.report import (
     save_report,
     save_review_csv,
 )
-from djsupport.spotify import RateLimitError, get_client
+from djsupport.spotify import (
+    REQUESTS_PER_SECOND,
+    RateLimitError,
+    configure_rate_limit,
+    get_client,
+)
 from djsupport.transfer import (
     AccountPublishingGuards,
     default_matching_knowledge_path,
@@ -30,9 +35,21 @@ DEFAULT_PUBLICATION_MANIFEST_PATH = str(default_publication_manifest_path())
 
 
 @click.group()
-def cli():
+@click.option(
+    "--max-rps", type=click.FloatRange(min=0, min_open=True), default=None,
+    help=(
+        "Proactive Spotify search pace in requests per second "
+        f"(default: {REQUESTS_PER_SECOND:g})."
+    ),
+)
+def cli(max_rps: float | None):
     """DJ Support - Transfer DJ selections to Spotify."""
     load_dotenv()
+    if max_rps is not None:
+        try:
+            configure_rate_limit(max_rps)
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), param_hint="'--max-rps'") from exc
 
 
 @cli.command("capabilities")
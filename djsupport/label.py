@@ -9,13 +9,17 @@ from urllib.parse import quote_plus
 
 import requests
 
-from djsupport.beatport import USER_AGENT, REQUEST_TIMEOUT, MAX_RESPONSE_SIZE, _parse_duration
+from djsupport.beatport import (
+    USER_AGENT, REQUEST_TIMEOUT, MAX_RESPONSE_SIZE, NEXT_DATA_PATTERN, _parse_duration,
+)
 from djsupport.rekordbox import Track
 
 BEATPORT_LABEL_URL_PREFIX = "beatport.com/label/"
 BEATPORT_LABEL_PATTERN = re.compile(
     r"^https://(www\.)?beatport\.com/label/[\w-]+/\d+(/tracks)?/?$"
 )
+SLUG_STRIP_PATTERN = re.compile(r"[^\w\s-]")
+SLUG_SEPARATOR_PATTERN = re.compile(r"[\s_]+")
 PER_PAGE = 150
 MAX_PAGES = 100  # Hard cap: 100 * 150 = 15,000 tracks maximum
 LARGE_LABEL_THRESHOLD = 1000
@@ -59,11 +63,16 @@ def validate_label_url(url: str) -> str:
     return url
 
 
-def _fetch_page(url: str, page: int) -> str:
-    """Fetch a single page of label tracks and return the HTML."""
-    page_url = f"{url}/tracks?page={page}&per_page={PER_PAGE}"
+def _read_beatport_html(
+    url: str, *, too_large: str, expected_prefix: str | None = None,
+) -> str:
+    """Stream a Beatport page within MAX_RESPONSE_SIZE and return its HTML.
+
+    Raises LabelParseError for oversized responses, unexpected redirects
+    (when expected_prefix is given), and anti-bot challenge pages.
+    """
     response = requests.get(
-        page_url,
+        url,
         headers={"User-Agent": USER_AGENT},
         timeout=REQUEST_TIMEOUT,
         stream=True,
@@ -76,15 +85,16 @@ def _fetch_page(url: str, page: int) -> str:
         size += len(chunk)
         if size > MAX_RESPONSE_SIZE:
             response.close()
-            raise LabelParseError("Response too large — does not look like a label page.")
+            raise LabelParseError(too_large)
         chunks.append(chunk)
     html = b"".join(chunks).decode(response.encoding or "utf-8")
 
-    final_url = response.url
-    if BEATPORT_LABEL_URL_PREFIX not in final_url:
-        raise LabelParseError(
-            f"Beatport redirected to an unexpected URL: {final_url}"
-        )
+    if expected_prefix is not None:
+        final_url = response.url
+        if expected_prefix not in final_url:
+            raise LabelParseError(
+                f"Beatport redirected to an unexpected URL: {final_url}"
+            )
 
     if "/human-test/" in html or "findProof" in html:
         raise LabelParseError(
@@ -95,13 +105,19 @@ def _fetch_page(url: str, page: int) -> str:
     return html
 
 
+def _fetch_page(url: str, page: int) -> str:
+    """Fetch a single page of label tracks and return the HTML."""
+    page_url = f"{url}/tracks?page={page}&per_page={PER_PAGE}"
+    return _read_beatport_html(
+        page_url,
+        too_large="Response too large — does not look like a label page.",
+        expected_prefix=BEATPORT_LABEL_URL_PREFIX,
+    )
+
+
 def _extract_next_data(html: str) -> dict:
     """Extract __NEXT_DATA__ JSON from HTML."""
-    match = re.search(
-        r'<script\s+id="__NEXT_DATA__"\s*[^>]*>(.*?)</script>',
-        html,
-        re.DOTALL,
-    )
+    match = NEXT_DATA_PATTERN.search(html)
     if not match:
         raise LabelParseError(
             "Could not find label data on page. "
@@ -121,6 +137,16 @@ def _parse_label_page(data: dict) -> tuple[str, list[Track], int]:
 
     Returns (label_name, tracks, total_count).
     """
+    label_name, results, total_count = _locate_label_results(data)
+    tracks = [_parse_label_track(item, i) for i, item in enumerate(results)]
+    return label_name, tracks, total_count
+
+
+def _locate_label_results(data: dict) -> tuple[str, list[dict], int]:
+    """Find the raw track results in __NEXT_DATA__ JSON without parsing them.
+
+    Returns (label_name, raw_results, total_count).
+    """
     try:
         queries = data["props"]["pageProps"]["dehydratedState"]["queries"]
     except (KeyError, TypeError) as e:
@@ -166,9 +192,7 @@ def _parse_label_page(data: dict) -> tuple[str, list[Track], int]:
     # Extract label name from page props
     page_props = data["props"]["pageProps"]
     label_name = page_props.get("label", {}).get("name", "Unknown Label")
-
-    tracks = [_parse_label_track(item, i) for i, item in enumerate(results)]
-    return label_name, tracks, total_count
+    return label_name, results, total_count
 
 
 def _parse_label_track(item: dict, position: int) -> Track:
@@ -189,15 +213,16 @@ def _parse_label_track(item: dict, position: int) -> Track:
 
     # Use publish_date or new_release_date for chronological ordering
     date_added = item.get("publish_date", item.get("new_release_date", ""))
+    release = item.get("release") or {}
 
     return Track(
         track_id=f"bp-label-{item.get('id', position)}",
         name=title,
         artist=artists,
-        album=item.get("release", {}).get("name", ""),
+        album=release.get("name", ""),
         remixer="",
-        label=item.get("release", {}).get("label", {}).get("name", ""),
-        genre=item.get("genre", {}).get("name", ""),
+        label=(release.get("label") or {}).get("name", ""),
+        genre=(item.get("genre") or {}).get("name", ""),
         date_added=date_added,
         duration=_parse_duration(item.get("length", "")),
     )
@@ -242,17 +267,20 @@ def fetch_label_tracks(
     # Fetch first page
     html = _fetch_page(url, 1)
     data = _extract_next_data(html)
-    label_name, tracks, total_count = _parse_label_page(data)
+    label_name, results, total_count = _locate_label_results(data)
 
-    if not tracks:
+    if not results:
         return label_name, []
 
     total_pages = min(math.ceil(total_count / PER_PAGE), MAX_PAGES)
 
-    # Allow caller to abort (e.g., >1000 track warning)
+    # Allow caller to abort (e.g., >1000 track warning) before any track
+    # on the first page is parsed.
     if on_total and on_total(total_count) is False:
         return label_name, []
 
+    tracks = [_parse_label_track(item, i) for i, item in enumerate(results)]
+
     if on_page:
         on_page(1, total_pages)
 
@@ -276,8 +304,8 @@ def fetch_label_tracks(
 
 def _slugify(name: str) -> str:
     """Convert a label name to a URL slug (lowercase, hyphens for spaces)."""
-    slug = re.sub(r"[^\w\s-]", "", name.lower())
-    return re.sub(r"[\s_]+", "-", slug).strip("-")
+    slug = SLUG_STRIP_PATTERN.sub("", name.lower())
+    return SLUG_SEPARATOR_PATTERN.sub("-", slug).strip("-")
 
 
 def search_labels(query: str) -> list[LabelResult]:
@@ -286,30 +314,7 @@ def search_labels(query: str) -> list[LabelResult]:
     Returns a list of LabelResult sorted by relevance.
     """
     search_url = f"https://www.beatport.com/search/labels?q={quote_plus(query)}"
-    response = requests.get(
-        search_url,
-        headers={"User-Agent": USER_AGENT},
-        timeout=REQUEST_TIMEOUT,
-        stream=True,
-    )
-    response.raise_for_status()
-
-    chunks = []
-    size = 0
-    for chunk in response.iter_content(chunk_size=8192, decode_unicode=False):
-        size += len(chunk)
-        if size > MAX_RESPONSE_SIZE:
-            response.close()
-            raise LabelParseError("Search response too large.")
-        chunks.append(chunk)
-    html = b"".join(chunks).decode(response.encoding or "utf-8")
-
-    if "/human-test/" in html or "findProof" in html:
-        raise LabelParseError(
-            "Beatport returned an anti-bot challenge page. "
-            "This may be temporary — try again in a few minutes."
-        )
-
+    html = _read_beatport_html(search_url, too_large="Search response too large.")
     data = _extract_next_data(html)
 
     try:
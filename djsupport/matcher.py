@@ -2,6 +2,7 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 
 from rapidfuzz import fuzz
 
@@ -10,22 +11,112 @@ from djsupport.rekordbox import Track
 EARLY_EXIT_THRESHOLD = 95  # Skip remaining strategies when Strategy 1 finds a high-confidence exact match
 from djsupport.spotify import search_track
 
+# _normalize builds durable cache keys, so its substitutions run in their
+# original order rather than as one alternation: each step can expose or
+# hide a match for the next (a removed tag can expose an " x " separator,
+# and a rewritten separator can stop a "feat." match).
+_COUNTRY_TAG_PATTERN = re.compile(r"\s*\([A-Z]{2,3}\)", re.IGNORECASE)
+_BRACKET_TAG_PATTERN = re.compile(r"\s*\[.*?\]")
+_SEPARATOR_PATTERN = re.compile(r"\s+x\s+")
+_FEATURING_PATTERN = re.compile(r"\b(feat\.?|ft\.?)\s+.*")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Version-descriptor patterns. Like _normalize, _strip_mix_info applies its
+# passes one after another in their original order.
+_MIX_PARENTHETICAL_PATTERN = re.compile(
+    r"\s*\(.*?(mix|remix|edit|version|dub|original|extended|radio|instrumental|interpretation|short)\)",
+    re.IGNORECASE,
+)
+_MIX_HYPHEN_PATTERN = re.compile(
+    r"\s+-\s+[^-]*\b(mix|remix|edit|version|dub|original|interpretation)\b.*$",
+    re.IGNORECASE,
+)
+_GROUP_CONTENT_PATTERN = re.compile(r"[\(\[]([^\)\]]+)[\)\]]")
+_MIX_WORD_PATTERN = re.compile(
+    r"\b(mix|remix|edit|version|dub|original|extended|radio|instrumental|interpretation|short)\b",
+    re.IGNORECASE,
+)
+_MIX_HYPHEN_DESCRIPTOR_PATTERN = re.compile(
+    r"\s+-\s+([^-]*\b(mix|remix|edit|version|dub|original|interpretation)\b.*)$",
+    re.IGNORECASE,
+)
+
+
+class _AccentFoldTable(dict):
+    """Lazily filled ``str.translate`` table folding one character at a time.
+
+    Each codepoint maps to its NFKD decomposition with combining marks
+    dropped. Canonical reordering only moves combining marks, which are
+    removed anyway, so translating per character matches folding the
+    whole string.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        folded = "".join(
+            ch for ch in unicodedata.normalize("NFKD", chr(codepoint))
+            if not unicodedata.combining(ch)
+        )
+        self[codepoint] = folded
+        return folded
+
+
+_ACCENT_FOLD = _AccentFoldTable()
+
+# Punctuation that survives _normalize but only adds token noise for RapidFuzz.
+# Kept out of _normalize itself because that also builds durable cache keys.
+# Separators split tokens; dots and apostrophes are deleted so initialisms
+# and contractions ("A.K.A.", "don't") stay one token.
+_PUNCT_STRIP = str.maketrans(
+    {c: " " for c in ",-_/|"} | {c: None for c in ".!?\"'"}
+)
+
 
+# Spotify candidates repeat the same artist credits and titles across
+# searches and tracks, and both functions below are pure.
+NORMALIZE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def _normalize(text: str) -> str:
     """Lowercase, strip whitespace, and remove common noise."""
     # Fold accents/diacritics so e.g. "För" and "For" compare equally.
-    text = unicodedata.normalize("NFKD", text)
-    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    # NFKD leaves ASCII unchanged, so most titles skip the fold entirely.
+    if not text.isascii():
+        text = text.translate(_ACCENT_FOLD)
     text = text.lower().strip()
     # Remove country tags like (IL), (UA), (UK)
-    text = re.sub(r"\s*\([A-Z]{2,3}\)", "", text, flags=re.IGNORECASE)
+    text = _COUNTRY_TAG_PATTERN.sub("", text)
     # Remove bracket tags like [Permanent Vacation], [Label Name]
-    text = re.sub(r"\s*\[.*?\]", "", text)
+    text = _BRACKET_TAG_PATTERN.sub("", text)
     # Replace "x" as artist separator with comma
-    text = re.sub(r"\s+x\s+", ", ", text)
+    text = _SEPARATOR_PATTERN.sub(", ", text)
     # Remove "feat." / "ft." and everything after within the string
-    text = re.sub(r"\b(feat\.?|ft\.?)\s+.*", "", text)
-    return re.sub(r"\s+", " ", text).strip()
+    text = _FEATURING_PATTERN.sub("", text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def _strip_punctuation(normalized: str) -> str:
+    """Drop scorer-only punctuation from already normalized text."""
+    return " ".join(normalized.translate(_PUNCT_STRIP).split())
+
+
+def _score_text(text: str) -> str:
+    """Normalize text for fuzzy scoring, dropping punctuation-only tokens."""
+    return _strip_punctuation(_normalize(text))
+
+
+def _score_similarity(text: str, other: str) -> float:
+    """Fuzzy-score two texts after normalizing and stripping punctuation.
+
+    When stripping empties both sides (e.g. "..." vs "!!!"), the normalized
+    texts are compared instead so punctuation-only names do not score 100.
+    """
+    normalized, other_normalized = _normalize(text), _normalize(other)
+    stripped = _strip_punctuation(normalized)
+    other_stripped = _strip_punctuation(other_normalized)
+    if not stripped and not other_stripped:
+        return fuzz.token_sort_ratio(normalized, other_normalized)
+    return fuzz.token_sort_ratio(stripped, other_stripped)
 
 
 def _collapse_repeated_parenthetical_groups(title: str) -> str:
@@ -52,6 +143,7 @@ def _collapse_repeated_parenthetical_groups(title: str) -> str:
     return title
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def _strip_mix_info(title: str) -> str:
     """Remove parenthetical remix/mix info and bracket tags from a title.
 
@@ -61,10 +153,10 @@ def _strip_mix_info(title: str) -> str:
          'What Is Real - Deep in the Playa Mix' -> 'What Is Real'
          'With Me - Original' -> 'With Me'
     """
-    title = re.sub(r"\s*\(.*?(mix|remix|edit|version|dub|original|extended|radio|instrumental|interpretation|short)\)", "", title, flags=re.IGNORECASE)
-    title = re.sub(r"\s*\[.*?\]", "", title)
+    title = _MIX_PARENTHETICAL_PATTERN.sub("", title)
+    title = _BRACKET_TAG_PATTERN.sub("", title)
     # Strip trailing hyphen descriptors like " - XYZ Remix" or " - Original" used by Spotify
-    title = re.sub(r"\s+-\s+[^-]*\b(mix|remix|edit|version|dub|original|interpretation)\b.*$", "", title, flags=re.IGNORECASE)
+    title = _MIX_HYPHEN_PATTERN.sub("", title)
     return title.strip()
 
 
@@ -77,16 +169,12 @@ def _extract_mix_descriptor(title: str) -> str | None:
 def _extract_mix_descriptors(title: str) -> list[str]:
     """Extract all version-like descriptors (mix/remix/edit/etc.) from a title."""
     descriptors: list[str] = []
-    candidates = re.findall(r"[\(\[]([^\)\]]+)[\)\]]", title)
+    candidates = _GROUP_CONTENT_PATTERN.findall(title)
     for c in candidates:
-        if re.search(r"\b(mix|remix|edit|version|dub|original|extended|radio|instrumental|interpretation|short)\b", c, flags=re.IGNORECASE):
+        if _MIX_WORD_PATTERN.search(c):
             descriptors.append(_normalize(c))
     # Spotify often uses "Track Name - XYZ Remix" instead of parentheses
-    hyphen_match = re.search(
-        r"\s+-\s+([^-]*\b(mix|remix|edit|version|dub|original|interpretation)\b.*)$",
-        title,
-        flags=re.IGNORECASE,
-    )
+    hyphen_match = _MIX_HYPHEN_DESCRIPTOR_PATTERN.search(title)
     if hyphen_match:
         descriptors.append(_normalize(hyphen_match.group(1)))
     # Preserve order, remove duplicates
@@ -132,10 +220,12 @@ def _contains_artist_identity(artist_credits: str, identity: str) -> bool:
 
 def _artist_score(track: Track, result: dict) -> tuple[float, str]:
     """Score artist identity, recognizing an explicitly named co-credited remixer."""
-    source_artist = _normalize(track.artist)
-    result_artist = _normalize(result["artist"])
-    score = fuzz.token_sort_ratio(source_artist, result_artist)
+    source_artist = _score_text(track.artist)
+    result_artist = _score_text(result["artist"])
+    score = _score_similarity(track.artist, result["artist"])
     remixer = _extract_remixer_identity(track)
+    if remixer:
+        remixer = _strip_punctuation(remixer)
 
     if (
         source_artist
@@ -143,7 +233,7 @@ def _artist_score(track: Track, result: dict) -> tuple[float, str]:
         and _contains_artist_identity(result_artist, source_artist)
         and _contains_artist_identity(result_artist, remixer)
     ):
-        credited_artists = _normalize(f"{track.artist}, {remixer}")
+        credited_artists = _score_text(f"{track.artist}, {remixer}")
         boosted_score = fuzz.token_sort_ratio(credited_artists, result_artist)
         if boosted_score > score:
             return boosted_score, "original artist and named remixer co-credited"
@@ -154,14 +244,12 @@ def _artist_score(track: Track, result: dict) -> tuple[float, str]:
 def _score_components(track: Track, result: dict) -> dict[str, float]:
     """Return matching score components for a Rekordbox/Spotify pair."""
     artist_score, _artist_score_reason = _artist_score(track, result)
-    norm_title = _normalize(_collapse_repeated_parenthetical_groups(track.name))
-    norm_result = _normalize(
+    raw_title_score = _score_similarity(
+        _collapse_repeated_parenthetical_groups(track.name),
         _collapse_repeated_parenthetical_groups(result["name"]),
     )
-    raw_title_score = fuzz.token_sort_ratio(norm_title, norm_result)
-    stripped_title_score = fuzz.token_sort_ratio(
-        _normalize(_strip_mix_info(track.name)),
-        _normalize(_strip_mix_info(result["name"])),
+    stripped_title_score = _score_similarity(
+        _strip_mix_info(track.name), _strip_mix_info(result["name"]),
     )
     return {
         "artist_score": artist_score,
@@ -264,10 +352,13 @@ def _duration_penalty(track_duration_s: int, result_duration_ms: int) -> float:
 
 def _score_result(
     track: Track, result: dict, components: dict[str, float] | None = None,
+    match_type: str | None = None,
 ) -> float:
     """Score a Spotify result against a Rekordbox track (0-100)."""
     if components is None:
         components = _score_components(track, result)
+    if match_type is None:
+        match_type = _classify_version_match(track, result)
     artist_score = components["artist_score"]
     title_score = components["raw_title_score"]
     stripped_score = components["stripped_title_score"]
@@ -276,7 +367,7 @@ def _score_result(
     # Penalize remix/edit variant mismatches. Base-title matching alone can
     # incorrectly treat different versions of the same track as exact matches.
     penalty = 0.0
-    if _classify_version_match(track, result) == "fallback_version":
+    if match_type == "fallback_version":
         # Looking for an unavailable/mismatched version. Keep candidate visible,
         # but reduce score so exact-version matches win when they exist.
         penalty += 15.0
@@ -289,14 +380,33 @@ def _score_result(
     return max(0.0, min(100.0, score))
 
 
-def _select_best(track: Track, results: list[dict], threshold: int) -> dict | None:
+ScoredCandidate = tuple[float, float, dict[str, float], str]
+
+
+def _score_candidate(track: Track, result: dict) -> ScoredCandidate:
+    """Return (exact_score, base_score, components, match_type) for one result."""
+    components = _score_components(track, result)
+    match_type = _classify_version_match(track, result)
+    exact_score = _score_result(track, result, components, match_type)
+    base_score = components["artist_score"] * 0.4 + components["stripped_title_score"] * 0.6
+    return exact_score, base_score, components, match_type
+
+
+def _select_best(
+    track: Track, results: list[dict], threshold: int,
+    scores: dict[str, ScoredCandidate] | None = None,
+) -> dict | None:
     """Score and select the best match from a list of Spotify results.
 
     Deduplicates by URI, scores all candidates, and returns the best match
     meeting the threshold. Prefers exact-version matches over fallback versions.
+    ``scores`` memoizes candidate scores by URI across repeated selections
+    for the same track as the candidate list grows.
     """
     if not results:
         return None
+    if scores is None:
+        scores = {}
 
     # Dedupe by URI
     seen: set[str] = set()
@@ -308,11 +418,10 @@ def _select_best(track: Track, results: list[dict], threshold: int) -> dict | No
 
     scored: list[tuple[dict, float, float, dict[str, float], str]] = []
     for r in unique:
-        components = _score_components(track, r)
-        exact_score = _score_result(track, r, components)
-        base_score = components["artist_score"] * 0.4 + components["stripped_title_score"] * 0.6
-        match_type = _classify_version_match(track, r)
-        scored.append((r, exact_score, base_score, components, match_type))
+        candidate = scores.get(r["uri"])
+        if candidate is None:
+            candidate = scores[r["uri"]] = _score_candidate(track, r)
+        scored.append((r, *candidate))
 
     # First pass: matching/default versions, including shorter representations
     # that must remain eligible for human review.
@@ -366,20 +475,41 @@ def _select_best(track: Track, results: list[dict], threshold: int) -> dict | No
     return None
 
 
-def _search_candidates(sp, track: Track, threshold: int) -> list[dict]:
-    """Gather candidates through the shared ordered Spotify search strategy."""
+SearchQuery = tuple[str, str, bool]
+
+
+def _search_candidates(
+    sp, track: Track, threshold: int,
+    scores: dict[str, ScoredCandidate] | None = None,
+    search_results: dict[SearchQuery, list[dict]] | None = None,
+) -> list[dict]:
+    """Gather candidates through the shared ordered Spotify search strategy.
+
+    ``search_results`` lets a caller reuse non-empty search responses across
+    tracks, e.g. duplicates spread over several playlists in one run.
+    """
+    if scores is None:
+        scores = {}
+    if search_results is None:
+        search_results = {}
     all_results: list[dict] = []
-    searched: set[tuple[str, str, bool]] = set()
+    searched: set[SearchQuery] = set()
 
     def search(artist: str, title: str, *, plain: bool = False) -> None:
         query = (artist, title, plain)
         if query in searched:
             return
         searched.add(query)
-        all_results.extend(search_track(sp, artist, title, plain=plain))
+        results = search_results.get(query)
+        if results is None:
+            results = search_track(sp, artist, title, plain=plain)
+            # Empty responses stay uncached so a later track can retry them.
+            if results:
+                search_results[query] = results
+        all_results.extend(results)
 
     search(track.artist, track.name)
-    early = _select_best(track, all_results, EARLY_EXIT_THRESHOLD)
+    early = _select_best(track, all_results, EARLY_EXIT_THRESHOLD, scores)
     if early is not None and early["match_type"] in {"exact", "shorter_version"}:
         return all_results
     stripped = _strip_mix_info(track.name)
@@ -400,7 +530,7 @@ def _search_candidates(sp, track: Track, threshold: int) -> list[dict]:
         track.artist.strip()
         and extension_match is not None
         and track.name[:extension_match.start()]
-        and _select_best(track, all_results, threshold) is None
+        and _select_best(track, all_results, threshold, scores) is None
     ):
         search(track.artist, track.name[:extension_match.start()])
     return all_results
@@ -408,24 +538,37 @@ def _search_candidates(sp, track: Track, threshold: int) -> list[dict]:
 
 def match_track(sp, track: Track, threshold: int = 80) -> dict | None:
     """Try to find a Spotify match for a Rekordbox track."""
-    all_results = _search_candidates(sp, track, threshold)
+    scores: dict[str, ScoredCandidate] = {}
+    all_results = _search_candidates(sp, track, threshold, scores)
 
-    return _select_best(track, all_results, threshold)
+    return _select_best(track, all_results, threshold, scores)
 
 
 def match_track_with_alternatives(
     sp, track: Track, threshold: int = 80,
+    search_results: dict[SearchQuery, list[dict]] | None = None,
 ) -> dict | None:
     """Return an acceptable match or up to three explained alternatives."""
-    all_results = _search_candidates(sp, track, threshold)
-    match = _select_best(track, all_results, threshold)
+    scores: dict[str, ScoredCandidate] = {}
+    all_results = _search_candidates(
+        sp, track, threshold, scores, search_results,
+    )
+    match = _select_best(track, all_results, threshold, scores)
     if match is not None:
         return match
+    # Alternatives rank the last result seen per URI, while the memo holds
+    # the first; reuse it only when both describe the same track.
+    first_seen: dict[str, dict] = {}
+    for candidate in all_results:
+        first_seen.setdefault(candidate["uri"], candidate)
     unique = {candidate["uri"]: candidate for candidate in all_results}
     ranked = []
     for candidate in unique.values():
-        components = _score_components(track, candidate)
-        score = _score_result(track, candidate, components)
+        scored = (
+            scores.get(candidate["uri"])
+            if first_seen[candidate["uri"]] == candidate else None
+        ) or _score_candidate(track, candidate)
+        score, _base_score, components, _match_type = scored
         ranked.append({
             **candidate,
             "score": score,
@@ -1,11 +1,12 @@
 """Parse Rekordbox XML library exports."""
 
+import sys
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     track_id: str
     name: str
@@ -24,7 +25,7 @@ class Track:
         return f"{self.artist} - {self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Playlist:
     name: str
     path: str  # e.g. "Baime 2022/Peak - Melodic"
@@ -39,37 +40,51 @@ def parse_xml(
     Returns:
         Tuple of (tracks dict keyed by TrackID, list of Playlists).
     """
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-
-    # Parse all tracks from COLLECTION
     tracks: dict[str, Track] = {}
-    collection = root.find("COLLECTION")
-    if collection is not None:
-        for track_el in collection.findall("TRACK"):
-            tid = track_el.get("TrackID", "")
-            total_time = track_el.get("TotalTime", "0")
+    playlists: list[Playlist] = []
+    # Artist, album, label, and genre repeat across many tracks; interning
+    # lets duplicates share one string and hash once.
+    intern = sys.intern
+    # Stream the file so COLLECTION tracks (and their TEMPO/POSITION_MARK
+    # children) are freed as soon as they are read; only the first
+    # COLLECTION and PLAYLISTS under the root are used.
+    open_elements: list[ET.Element] = []
+    seen_collection = seen_playlists = False
+    for event, element in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            open_elements.append(element)
+            continue
+        open_elements.pop()
+        depth = len(open_elements)
+        if (
+            depth == 2 and element.tag == "TRACK"
+            and open_elements[1].tag == "COLLECTION" and not seen_collection
+        ):
+            tid = element.get("TrackID", "")
+            total_time = element.get("TotalTime", "0")
             tracks[tid] = Track(
                 track_id=tid,
-                name=track_el.get("Name", ""),
-                artist=track_el.get("Artist", ""),
-                album=track_el.get("Album", ""),
-                remixer=track_el.get("Remixer", ""),
-                label=track_el.get("Label", ""),
-                genre=track_el.get("Genre", ""),
-                date_added=track_el.get("DateAdded", ""),
+                name=element.get("Name", ""),
+                artist=intern(element.get("Artist", "")),
+                album=intern(element.get("Album", "")),
+                remixer=element.get("Remixer", ""),
+                label=intern(element.get("Label", "")),
+                genre=intern(element.get("Genre", "")),
+                date_added=element.get("DateAdded", ""),
                 duration=int(total_time) if total_time.isdigit() else 0,
-                location=(track_el.get("Location", "") if include_locations else ""),
-                version=track_el.get("Mix", ""),
+                location=(element.get("Location", "") if include_locations else ""),
+                version=element.get("Mix", ""),
             )
-
-    # Parse playlist tree
-    playlists: list[Playlist] = []
-    playlists_el = root.find("PLAYLISTS")
-    if playlists_el is not None:
-        root_node = playlists_el.find("NODE")
-        if root_node is not None:
-            _walk_nodes(root_node, "", playlists)
+            open_elements[1].clear()
+        elif depth == 1 and element.tag == "COLLECTION":
+            seen_collection = True
+            element.clear()
+        elif depth == 1 and element.tag == "PLAYLISTS" and not seen_playlists:
+            seen_playlists = True
+            root_node = element.find("NODE")
+            if root_node is not None:
+                _walk_nodes(root_node, "", playlists)
+            element.clear()
 
     return tracks, playlists
 
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import csv
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
 if TYPE_CHECKING:
     from djsupport.transfer import PublicationManifest
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchedTrack:
     source_name: str
     spotify_name: str
@@ -97,7 +99,7 @@ def _spotify_url(uri: str) -> str:
     return uri
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistReport:
     name: str
     path: str
@@ -133,7 +135,7 @@ class PlaylistReport:
         return (len(self.matched) / self.total * 100) if self.total else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncReport:
     timestamp: datetime
     threshold: int
@@ -144,6 +146,14 @@ class SyncReport:
     transfer_id: str | None = None
     status: str = "completed"
 
+    def track_totals(self) -> tuple[int, int]:
+        """Return (matched, unmatched) track counts in one pass over playlists."""
+        matched = unmatched = 0
+        for p in self.playlists:
+            matched += len(p.matched)
+            unmatched += len(p.unmatched)
+        return matched, unmatched
+
     @property
     def total_matched(self) -> int:
         return sum(len(p.matched) for p in self.playlists)
@@ -154,8 +164,29 @@ class SyncReport:
 
     @property
     def overall_match_rate(self) -> float:
-        total = self.total_matched + self.total_unmatched
-        return (self.total_matched / total * 100) if total else 0.0
+        return _match_rate(*self.track_totals())
+
+
+def _match_rate(matched: int, unmatched: int) -> float:
+    total = matched + unmatched
+    return (matched / total * 100) if total else 0.0
+
+
+def _score_summary(matched: list[MatchedTrack]) -> tuple[float, float, float, int]:
+    """Return (avg, min, max, fallback count) over non-empty matches in one pass."""
+    low = high = matched[0].score
+    total = 0.0
+    fallback_count = 0
+    for m in matched:
+        score = m.score
+        total += score
+        if score < low:
+            low = score
+        elif score > high:
+            high = score
+        if m.match_type == "fallback_version":
+            fallback_count += 1
+    return total / len(matched), low, high, fallback_count
 
 
 def print_report(report: SyncReport) -> None:
@@ -164,69 +195,97 @@ def print_report(report: SyncReport) -> None:
 
     ts = report.timestamp.strftime("%Y-%m-%d %H:%M")
     mode = "Preview" if report.dry_run else "Transfer"
+    lines: list[str] = []
 
-    click.echo()
-    click.echo("\u2550" * 42)
-    click.echo(f"  Transfer Report  {ts}")
-    click.echo(f"  Mode: {mode}  |  Threshold: {report.threshold}")
+    lines.append("")
+    lines.append("\u2550" * 42)
+    lines.append(f"  Transfer Report  {ts}")
+    lines.append(f"  Mode: {mode}  |  Threshold: {report.threshold}")
     if report.transfer_id:
-        click.echo(f"  Transfer: {report.transfer_id}  |  Status: {report.status}")
-    click.echo("\u2550" * 42)
+        lines.append(f"  Transfer: {report.transfer_id}  |  Status: {report.status}")
+    lines.append("\u2550" * 42)
 
     for pl in report.playlists:
-        click.echo()
-        click.echo(
+        lines.append("")
+        lines.append(
             f"Playlist: {pl.path}  ({pl.action})  |  Outcome: {pl.outcome}"
         )
-        click.echo(f"  Matched:  {len(pl.matched)}/{pl.total} ({pl.match_rate:.1f}%)")
+        lines.append(f"  Matched:  {len(pl.matched)}/{pl.total} ({pl.match_rate:.1f}%)")
 
         if pl.matched:
-            scores = [m.score for m in pl.matched]
-            click.echo(
-                f"  Scores:   avg {sum(scores)/len(scores):.1f}"
-                f"  min {min(scores):.1f}"
-                f"  max {max(scores):.1f}"
+            avg, low, high, fallback_count = _score_summary(pl.matched)
+            lines.append(
+                f"  Scores:   avg {avg:.1f}"
+                f"  min {low:.1f}"
+                f"  max {high:.1f}"
             )
-            fallback_count = sum(1 for m in pl.matched if m.match_type == "fallback_version")
             if fallback_count:
-                click.echo(f"  Version fallbacks: {fallback_count}")
+                lines.append(f"  Version fallbacks: {fallback_count}")
 
         if pl.unmatched:
-            click.echo(f"  Unmatched ({len(pl.unmatched)}):")
+            lines.append(f"  Unmatched ({len(pl.unmatched)}):")
             for name in pl.unmatched:
-                click.echo(f"    - {name}")
+                lines.append(f"    - {name}")
 
         if report.cache_enabled:
-            click.echo(f"  Cache: {pl.cache_hits} hits | {pl.api_lookups} API | {pl.retried} retries")
+            lines.append(f"  Cache: {pl.cache_hits} hits | {pl.api_lookups} API | {pl.retried} retries")
         if (
             pl.local_audio_eligible or pl.local_audio_observed
             or pl.local_audio_unavailable or pl.local_audio_reused
         ):
-            click.echo(
+            lines.append(
                 f"  Local audio: {pl.local_audio_eligible} eligible"
                 f" | {pl.local_audio_observed} observed"
                 f" | {pl.local_audio_reused} Approved Match reuses"
                 f" | {pl.local_audio_unavailable} unavailable"
             )
 
-    click.echo()
-    click.echo("\u2500" * 42)
+    lines.append("")
+    lines.append("\u2500" * 42)
     total_cache = sum(p.cache_hits for p in report.playlists)
     total_api = sum(p.api_lookups for p in report.playlists)
     total_retries = sum(p.retried for p in report.playlists)
-    click.echo(
+    total_matched, total_unmatched = report.track_totals()
+    lines.append(
         f"  TOTALS: {len(report.playlists)} playlists"
-        f" | {report.total_matched} matched"
-        f" | {report.total_unmatched} unmatched"
+        f" | {total_matched} matched"
+        f" | {total_unmatched} unmatched"
+    )
+    lines.append(
+        f"  Overall match rate: {_match_rate(total_matched, total_unmatched):.1f}%"
     )
-    click.echo(f"  Overall match rate: {report.overall_match_rate:.1f}%")
     if report.cache_enabled:
-        click.echo(f"  Cache: {total_cache} hits | {total_api} API calls | {total_retries} retries")
-    click.echo("\u2500" * 42)
+        lines.append(f"  Cache: {total_cache} hits | {total_api} API calls | {total_retries} retries")
+    lines.append("\u2500" * 42)
+    click.echo("\n".join(lines))
+
+
+_VERSION_REVIEW_TYPES = frozenset({"fallback_version", "shorter_version"})
+
+
+def _write_lines(f: TextIO, lines: list[str]) -> None:
+    """Write one finished report section and reset the buffer for the next."""
+    f.writelines(f"{line}\n" for line in lines)
+    lines.clear()
 
 
 def save_report(report: SyncReport, path: str) -> None:
-    """Save a detailed Markdown report to a file."""
+    """Save a detailed Markdown report to a file.
+
+    Sections stream into a sibling temporary file that replaces ``path`` only
+    once the report is complete, so a failure keeps the previous report.
+    """
+    temporary = Path(f"{path}.tmp")
+    try:
+        with open(temporary, "w") as f:
+            _write_markdown_report(report, f)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    os.replace(temporary, path)
+
+
+def _write_markdown_report(report: SyncReport, f: TextIO) -> None:
     ts = report.timestamp.strftime("%Y-%m-%d %H:%M")
     mode = "Preview" if report.dry_run else "Transfer"
     lines: list[str] = []
@@ -239,7 +298,9 @@ def save_report(report: SyncReport, path: str) -> None:
     elif report.status != "completed":
         lines.append(f"**Status:** {report.status}")
     lines.append("")
+    _write_lines(f, lines)
 
+    low_confidence: list[tuple[str, MatchedTrack, str]] = []
     for pl in report.playlists:
         lines.append(f"## {pl.path}  ({pl.action})")
         lines.append("")
@@ -248,13 +309,12 @@ def save_report(report: SyncReport, path: str) -> None:
         lines.append(f"**Matched:** {len(pl.matched)}/{pl.total} ({pl.match_rate:.1f}%)")
 
         if pl.matched:
-            scores = [m.score for m in pl.matched]
+            avg, low, high, fallback_count = _score_summary(pl.matched)
             lines.append(
-                f"**Scores:** avg {sum(scores)/len(scores):.1f}"
-                f" | min {min(scores):.1f}"
-                f" | max {max(scores):.1f}"
+                f"**Scores:** avg {avg:.1f}"
+                f" | min {low:.1f}"
+                f" | max {high:.1f}"
             )
-            fallback_count = sum(1 for m in pl.matched if m.match_type == "fallback_version")
             if fallback_count:
                 lines.append(f"**Version fallbacks:** {fallback_count}")
 
@@ -277,6 +337,8 @@ def save_report(report: SyncReport, path: str) -> None:
                     f"| {m.source_track_id} | {m.source_name} | {proposal}"
                     f" | {m.score:.1f} | {m.match_type} | {reasons} |"
                 )
+                if m.score < 90 or m.match_type in _VERSION_REVIEW_TYPES:
+                    low_confidence.append((pl.path, m, reasons))
             lines.append("")
 
         for uncertain in pl.alternatives:
@@ -356,16 +418,9 @@ def save_report(report: SyncReport, path: str) -> None:
             for name in pl.unmatched:
                 lines.append(f"- {name}")
             lines.append("")
+        _write_lines(f, lines)
 
-    # Low confidence section
-    low_confidence = []
-    for pl in report.playlists:
-        for m in pl.matched:
-            if m.score < 90 or m.match_type in {
-                "fallback_version", "shorter_version",
-            }:
-                low_confidence.append((pl.path, m))
-
+    # Low confidence section, collected while writing the matched tables
     if low_confidence:
         lines.append("## Low Confidence and Version Review Matches")
         lines.append("")
@@ -376,23 +431,24 @@ def save_report(report: SyncReport, path: str) -> None:
         lines.append(
             "|----------|-----------|---------------|-------|------------|---------|"
         )
-        for pl_path, m in low_confidence:
-            reasons = "; ".join(m.score_reasons)
+        for pl_path, m, reasons in low_confidence:
             lines.append(
                 f"| {pl_path} | {m.source_name}"
                 f" | {m.spotify_artist} - {m.spotify_name} | {m.score:.1f}"
                 f" | {m.match_type} | {reasons} |"
             )
         lines.append("")
+        _write_lines(f, lines)
 
     # Totals
     lines.append("---")
     lines.append("")
+    total_matched, total_unmatched = report.track_totals()
     lines.append(
         f"**Totals:** {len(report.playlists)} playlists"
-        f" | {report.total_matched} matched"
-        f" | {report.total_unmatched} unmatched"
-        f" | {report.overall_match_rate:.1f}% match rate"
+        f" | {total_matched} matched"
+        f" | {total_unmatched} unmatched"
+        f" | {_match_rate(total_matched, total_unmatched):.1f}% match rate"
     )
     if report.cache_enabled:
         total_cache = sum(p.cache_hits for p in report.playlists)
@@ -414,10 +470,7 @@ def save_report(report: SyncReport, path: str) -> None:
             f" | {local_reused} Approved Match reuses"
             f" | {local_unavailable} unavailable"
         )
-    lines.append("")
-
-    with open(path, "w") as f:
-        f.write("\n".join(lines))
+    _write_lines(f, lines)
 
 
 def save_review_csv(report: SyncReport, path: str) -> None:
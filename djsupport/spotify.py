@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+import threading
 import time
 from collections.abc import Callable
 from typing import Any
@@ -12,6 +14,63 @@ from spotipy.oauth2 import SpotifyOAuth
 SCOPES = "playlist-read-private playlist-modify-public playlist-modify-private"
 
 MAX_RATE_LIMIT_WAIT = 60  # seconds — abort if Spotify asks us to wait longer
+MAX_RATE_LIMIT_RETRIES = 3  # short 429 retries before giving up on a call
+
+
+REQUESTS_PER_SECOND = 5.0  # steady proactive pace for Spotify searches
+REQUEST_BURST = 10  # searches allowed back to back before pacing starts
+
+
+class TokenBucket:
+    """Pace calls proactively so most requests never reach a 429."""
+
+    def __init__(
+        self, capacity: int, refill_rate: float, *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.refill_rate,
+            )
+            self._updated = now
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.refill_rate
+                self._sleep(wait)
+                self._tokens = 1.0
+                self._updated = now + wait
+            self._tokens -= 1
+
+    def drain(self) -> None:
+        """Drop to a quarter of capacity after Spotify signals overload."""
+        with self._lock:
+            self._tokens = min(self._tokens, self.capacity / 4)
+
+
+_rate_limiter: TokenBucket | None = TokenBucket(REQUEST_BURST, REQUESTS_PER_SECOND)
+
+
+def configure_rate_limit(requests_per_second: float | None) -> None:
+    """Set the proactive pace for Spotify searches; None disables it."""
+    global _rate_limiter
+    if requests_per_second is None:
+        _rate_limiter = None
+        return
+    if not math.isfinite(requests_per_second) or requests_per_second <= 0:
+        raise ValueError("requests_per_second must be a positive finite number")
+    _rate_limiter = TokenBucket(REQUEST_BURST, requests_per_second)
 
 
 class RateLimitError(Exception):
@@ -67,33 +126,51 @@ def _parse_retry_after(exc: spotipy.SpotifyException) -> int:
         return 1
 
 
+def _retryable_wait(
+    exc: spotipy.SpotifyException, limiter: TokenBucket | None,
+) -> int:
+    """Return the Retry-After wait for a short-lived 429; raise for anything else."""
+    if exc.http_status == 403:
+        raise SpotifyCapabilityError("playlist-read-private") from exc
+    if exc.http_status != 429:
+        raise exc
+    if "QUOTA_EXCEEDED" in str(exc).upper():
+        raise QuotaExceededError(
+            "Spotify quota exhausted; Transfer checkpointed and paused"
+        ) from exc
+    if limiter is not None:
+        limiter.drain()
+    return _parse_retry_after(exc)
+
+
 def _api_call_with_rate_limit(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
     """Execute a Spotify API call, handling rate limits gracefully.
 
-    Short waits (<=MAX_RATE_LIMIT_WAIT) are retried automatically.
-    Long waits raise RateLimitError so the CLI can save cache and exit.
+    Every attempt first passes the proactive rate limiter. Short waits are
+    retried up to MAX_RATE_LIMIT_RETRIES times with exponential backoff
+    while the total wait stays within MAX_RATE_LIMIT_WAIT. Longer waits,
+    or a 429 on the final attempt, raise RateLimitError so the CLI can save
+    cache and exit.
     """
-    try:
-        return func(*args, **kwargs)
-    except spotipy.SpotifyException as e:
-        if e.http_status == 429:
-            if "QUOTA_EXCEEDED" in str(e).upper():
-                raise QuotaExceededError(
-                    "Spotify quota exhausted; Transfer checkpointed and paused"
-                ) from e
-            retry_after = _parse_retry_after(e)
-            if retry_after <= MAX_RATE_LIMIT_WAIT:
-                time.sleep(retry_after)
-                try:
-                    return func(*args, **kwargs)
-                except spotipy.SpotifyException as e2:
-                    if e2.http_status == 429:
-                        raise RateLimitError(_parse_retry_after(e2)) from e2
-                    raise
-            raise RateLimitError(retry_after) from e
-        if e.http_status == 403:
-            raise SpotifyCapabilityError("playlist-read-private") from e
-        raise
+    waited = 0
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        limiter = _rate_limiter
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return func(*args, **kwargs)
+        except spotipy.SpotifyException as e:
+            retry_after = _retryable_wait(e, limiter)
+            # Spotify often answers a minimal Retry-After with another 429;
+            # grow the wait so repeated retries do not hammer the window.
+            wait = max(retry_after, 2 ** attempt)
+            if (
+                attempt == MAX_RATE_LIMIT_RETRIES
+                or waited + wait > MAX_RATE_LIMIT_WAIT
+            ):
+                raise RateLimitError(retry_after) from e
+            time.sleep(wait)
+            waited += wait
 
 
 def search_track(
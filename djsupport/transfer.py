@@ -35,7 +35,7 @@ else:
 
 from djsupport.cache import MatchCache
 from djsupport.local_audition import LocalAuditionResult
-from djsupport.matcher import match_track_with_alternatives
+from djsupport.matcher import SearchQuery, match_track_with_alternatives
 from djsupport.rekordbox import Track
 from djsupport.report import (
     AlternativeCandidate,
@@ -1519,10 +1519,16 @@ class SpotifyMatcher:
 
     def __init__(self, client) -> None:
         self._client = client
+        self._account_id: str | None = None
+        self._search_results: dict[SearchQuery, list[dict]] = {}
 
     def account_id(self) -> str:
-        profile = self._client.current_user()
-        return profile.get("account_id") or profile["id"]
+        # One client is bound to one token for its lifetime, so the account
+        # cannot change underneath this adapter; ask Spotify only once.
+        if self._account_id is None:
+            profile = self._client.current_user()
+            self._account_id = profile.get("account_id") or profile["id"]
+        return self._account_id
 
     def create_playlist(self, name: str, description: str) -> str:
         playlist = self._client._post("me/playlists", payload={
@@ -1606,6 +1612,7 @@ class SpotifyMatcher:
     def match(self, track: Track, threshold: int) -> dict | None:
         return match_track_with_alternatives(
             self._client, track, threshold=threshold,
+            search_results=self._search_results,
         )
 
     def publish_provisional_snapshot(
@@ -1653,7 +1660,10 @@ class SpotifyMatcher:
 
     def provisional_playlist_track_uris(self, playlist_id: str) -> list[str] | None:
         try:
-            page = self._client.playlist_items(playlist_id)
+            # Only URIs are read; keep Spotify from sending full track objects.
+            page = self._client.playlist_items(
+                playlist_id, fields="items(track(uri)),next",
+            )
         except spotipy.SpotifyException as exc:
             if exc.http_status == 404:
                 return None
@@ -1750,7 +1760,7 @@ class MatchCacheKnowledge:
         self._cache.store(track.artist, track.name, threshold, result)
 
     def checkpoint(self) -> None:
-        self._cache.save()
+        self._cache.save_if_dirty()
 
     def approve(self, item: PublicationItem) -> ApprovalConflict | None:
         conflict = self._cache.record_approval(
@@ -4929,14 +4939,15 @@ class Transfer:
         corrected_uris = {item.spotify_uri for item in corrected_items.values()}
         managed_uris = original_uris | corrected_uris
         present = Counter(current_uris)
-        desired = []
+        # Insertion-ordered dict: first occurrence wins, membership is O(1).
+        desired_order: dict[str, None] = {}
         for item in manifest.items:
             correction = corrected_items.get(item.source_track_id)
             if correction is not None:
-                if correction.spotify_uri not in desired:
-                    desired.append(correction.spotify_uri)
-            elif present[item.spotify_uri] and item.spotify_uri not in desired:
-                desired.append(item.spotify_uri)
+                desired_order.setdefault(correction.spotify_uri)
+            elif present[item.spotify_uri]:
+                desired_order.setdefault(item.spotify_uri)
+        desired = list(desired_order)
 
         manual_by_managed_boundary: dict[int, list[str]] = {}
         managed_seen = 0
@@ -25,7 +25,7 @@ from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from spotipy.oauth2 import SpotifyOAuth
 
-from djsupport.report import SyncReport
+from djsupport.report import SyncReport, _match_rate
 from djsupport.spotify import SCOPES
 from djsupport.local_audition import (
     AuditionHandleUnavailable,
@@ -1145,6 +1145,7 @@ def _report_to_dict(report: SyncReport) -> dict[str, Any]:
             "local_audio_unavailable": playlist.local_audio_unavailable,
             "local_audio_reused": playlist.local_audio_reused,
         })
+    total_matched, total_unmatched = report.track_totals()
     return {
         "timestamp": report.timestamp.isoformat(),
         "threshold": report.threshold,
@@ -1153,9 +1154,9 @@ def _report_to_dict(report: SyncReport) -> dict[str, Any]:
         "transfer_id": report.transfer_id,
         "status": report.status,
         "playlists": playlists,
-        "total_matched": report.total_matched,
-        "total_unmatched": report.total_unmatched,
-        "overall_match_rate": report.overall_match_rate,
+        "total_matched": total_matched,
+        "total_unmatched": total_unmatched,
+        "overall_match_rate": _match_rate(total_matched, total_unmatched),
         "local_audio_eligible": sum(
             playlist.local_audio_eligible for playlist in report.playlists
         ),
@@ -4,10 +4,18 @@ from pathlib import Path
 
 import pytest
 
+from djsupport import spotify
+
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def library_xml():
-    """Path to the sample Rekordbox XML fixture."""
+    """Path to the read-only sample Rekordbox XML fixture."""
     return FIXTURES_DIR / "library.xml"
+
+
+@pytest.fixture(autouse=True)
+def unpaced_spotify_calls(monkeypatch):
+    """Keep mocked Spotify calls free of real-time proactive pacing."""
+    monkeypatch.setattr(spotify, "_rate_limiter", None)
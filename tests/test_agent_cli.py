@@ -2,8 +2,10 @@
 
 import json
 
+import pytest
 from click.testing import CliRunner
 
+from djsupport import spotify
 from djsupport.cli import cli
 
 
@@ -290,3 +292,18 @@ def test_qualification_cli_exposes_explicit_draft_and_apply_operations():
     assert "--apply" in result.output
     assert "--authorize-private-source" in result.output
     assert "--authorize-spotify-write" in result.output
+
+
+class TestMaxRpsOption:
+    def test_sets_the_spotify_search_pace(self):
+        result = CliRunner().invoke(cli, ["--max-rps", "2", "capabilities"])
+
+        assert result.exit_code == 0
+        assert spotify._rate_limiter.refill_rate == 2.0
+
+    @pytest.mark.parametrize("rate", ["0", "-1", "nan", "inf"])
+    def test_rejects_rates_that_cannot_pace(self, rate):
+        result = CliRunner().invoke(cli, ["--max-rps", rate, "capabilities"])
+
+        assert result.exit_code == 2
+        assert "--max-rps" in result.output
@@ -14,6 +14,7 @@ from djsupport.beatport import (
     _parse_duration,
     BeatportParseError,
     InvalidBeatportURL,
+    MAX_RESPONSE_SIZE,
 )
 from djsupport.rekordbox import Track
 
@@ -74,26 +75,17 @@ class TestValidateUrl:
 
 
 class TestParseDuration:
-    def test_minutes_seconds(self):
-        assert _parse_duration("4:44") == 284
-
-    def test_hours_minutes_seconds(self):
-        assert _parse_duration("1:04:30") == 3870
-
-    def test_empty_string(self):
-        assert _parse_duration("") == 0
-
-    def test_no_colon(self):
-        assert _parse_duration("284") == 0
-
-    def test_invalid_numbers(self):
-        assert _parse_duration("4:ab") == 0
-
-    def test_single_part(self):
-        assert _parse_duration("4:") == 0
-
-    def test_four_parts(self):
-        assert _parse_duration("1:2:3:4") == 0
+    @pytest.mark.parametrize("value, expected", [
+        pytest.param("4:44", 284, id="minutes_seconds"),
+        pytest.param("1:04:30", 3870, id="hours_minutes_seconds"),
+        pytest.param("", 0, id="empty_string"),
+        pytest.param("284", 0, id="no_colon"),
+        pytest.param("4:ab", 0, id="invalid_numbers"),
+        pytest.param("4:", 0, id="single_part"),
+        pytest.param("1:2:3:4", 0, id="four_parts"),
+    ])
+    def test_parse_duration(self, value, expected):
+        assert _parse_duration(value) == expected
 
 
 class TestParseTrack:
@@ -303,8 +295,12 @@ class TestFetchChart:
     @patch("djsupport.beatport.requests.get")
     def test_response_too_large(self, mock_get):
         mock = MagicMock()
-        # Simulate a response larger than MAX_RESPONSE_SIZE
-        mock.iter_content.return_value = [b"x" * (6 * 1024 * 1024)]
+        # Simulate a response larger than MAX_RESPONSE_SIZE, streamed in
+        # chunks that all share one small buffer.
+        chunk = b"x" * (64 * 1024)
+        mock.iter_content.return_value = [chunk] * (
+            MAX_RESPONSE_SIZE // len(chunk) + 1
+        )
         mock.encoding = "utf-8"
         mock.url = "https://www.beatport.com/chart/test/123"
         mock.raise_for_status = MagicMock()
@@ -312,6 +308,7 @@ class TestFetchChart:
         mock_get.return_value = mock
         with pytest.raises(BeatportParseError, match="too large"):
             fetch_chart("https://www.beatport.com/chart/test/123")
+        mock.close.assert_called_once_with()
 
     @patch("djsupport.beatport.requests.get")
     def test_successful_parse(self, mock_get):
@@ -83,6 +83,25 @@ class TestMatchCacheLoad:
         data = json.loads((tmp_path / "cache.json").read_text())
         assert data["version"] == CACHE_VERSION
 
+    def test_save_replaces_file_without_leaving_temporary(self, tmp_path):
+        path = tmp_path / "cache.json"
+        c = MatchCache(path=str(path))
+        c.store("Artist", "Title", 80, _matched_result())
+        c.save()
+        assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+    def test_save_if_dirty_skips_unchanged_cache(self, tmp_path):
+        path = tmp_path / "cache.json"
+        c = MatchCache(path=str(path))
+        c.save_if_dirty()
+        assert path.exists()
+        path.write_text("sentinel")
+        c.save_if_dirty()
+        assert path.read_text() == "sentinel"
+        c.store("Artist", "Title", 80, _matched_result())
+        c.save_if_dirty()
+        assert json.loads(path.read_text())["version"] == CACHE_VERSION
+
 
 class TestMatchCacheStore:
     def test_stores_successful_match(self, cache):
@@ -20,6 +20,7 @@ from djsupport.label import (
     PER_PAGE,
     MAX_PAGES,
     LARGE_LABEL_THRESHOLD,
+    MAX_RESPONSE_SIZE,
 )
 from djsupport.rekordbox import Track
 
@@ -159,6 +160,16 @@ class TestParseLabelTrack:
         assert track.album == ""
         assert track.label == ""
 
+    def test_null_release_and_genre(self):
+        item = {
+            "id": 1, "name": "Test", "mix_name": "", "length": "3:00",
+            "release": {"name": "Test EP", "label": None}, "genre": None,
+        }
+        track = _parse_label_track(item, 0)
+        assert track.album == "Test EP"
+        assert track.label == ""
+        assert track.genre == ""
+
     def test_position_used_as_fallback_id(self):
         item = {"name": "Test", "mix_name": "", "length": "3:00"}
         track = _parse_label_track(item, 5)
@@ -386,7 +397,11 @@ class TestDeduplicateTracks:
 class TestFetchLabelTracks:
     def _mock_response(self, content, url="https://www.beatport.com/label/test/123/tracks", encoding="utf-8"):
         mock = MagicMock()
-        mock.iter_content.return_value = [content.encode(encoding) if isinstance(content, str) else content]
+        body = content.encode(encoding) if isinstance(content, str) else content
+        # Honour chunk_size like requests does, so the streamed read is exercised.
+        mock.iter_content.side_effect = lambda chunk_size=1, decode_unicode=False: (
+            body[i:i + chunk_size] for i in range(0, len(body), chunk_size)
+        )
         mock.encoding = encoding
         mock.url = url
         mock.raise_for_status = MagicMock()
@@ -463,8 +478,16 @@ class TestFetchLabelTracks:
 
     @patch("djsupport.label.requests.get")
     def test_response_too_large(self, mock_get):
+        chunk = b"x" * (64 * 1024)
+        yielded = []
+
+        def endless_body(chunk_size=1, decode_unicode=False):
+            while True:
+                yielded.append(chunk)
+                yield chunk
+
         mock = MagicMock()
-        mock.iter_content.return_value = [b"x" * (6 * 1024 * 1024)]
+        mock.iter_content.side_effect = endless_body
         mock.encoding = "utf-8"
         mock.url = "https://www.beatport.com/label/test/123/tracks"
         mock.raise_for_status = MagicMock()
@@ -472,6 +495,21 @@ class TestFetchLabelTracks:
         mock_get.return_value = mock
         with pytest.raises(LabelParseError, match="too large"):
             fetch_label_tracks("https://www.beatport.com/label/test/123")
+        # Reading stops at the first chunk past the cap.
+        assert len(yielded) == MAX_RESPONSE_SIZE // len(chunk) + 1
+        mock.close.assert_called_once_with()
+
+    @patch("djsupport.label.requests.get")
+    def test_multibyte_text_split_across_chunks(self, mock_get):
+        label_name = "Label €" * 2000
+        # Emit the euro sign raw so its UTF-8 bytes straddle chunk boundaries.
+        html = self._make_label_html(label_name=label_name).replace("\\u20ac", "€")
+        assert "€" in html
+        mock_get.return_value = self._mock_response(html)
+
+        name, tracks = fetch_label_tracks("https://www.beatport.com/label/test/123")
+        assert name == label_name
+        assert len(tracks) == 1
 
     @patch("djsupport.label.requests.get")
     def test_empty_label_returns_empty_list(self, mock_get):
@@ -535,6 +573,18 @@ class TestFetchLabelTracks:
         assert name == "Test Label"
         assert tracks == []
 
+    @patch("djsupport.label._parse_label_track")
+    @patch("djsupport.label.requests.get")
+    def test_on_total_abort_skips_track_parsing(self, mock_get, parse_track):
+        html = self._make_label_html(total_count=2000)
+        mock_get.return_value = self._mock_response(html)
+
+        fetch_label_tracks(
+            "https://www.beatport.com/label/test/123",
+            on_total=lambda total: False,
+        )
+        parse_track.assert_not_called()
+
     @patch("djsupport.label.requests.get")
     def test_on_total_callback_continue(self, mock_get):
         html = self._make_label_html(total_count=1)
@@ -10,6 +10,7 @@ application storage and is never loaded from a repository fixture.
 
 import argparse
 from pathlib import Path
+from typing import NamedTuple
 
 from dotenv import load_dotenv
 
@@ -22,6 +23,18 @@ from djsupport.regression import load_local_regressions
 from djsupport.transfer import default_matching_knowledge_path
 
 
+class AccuracyResult(NamedTuple):
+    track: Track
+    status: str
+    expected_uri: str
+    got_uri: str | None
+    score: float | None
+    match_type: str | None
+    got_name: str | None
+    got_artist: str | None
+    got_duration_ms: int | None
+
+
 def run_accuracy_test(knowledge_path: Path | None = None):
     knowledge_path = knowledge_path or default_matching_knowledge_path()
     regression_cases = load_local_regressions(knowledge_path)
@@ -37,7 +50,7 @@ def run_accuracy_test(knowledge_path: Path | None = None):
     correct = 0
     wrong = 0
     missed = 0
-    results = []
+    results: list[AccuracyResult] = []
 
     for row in regression_cases:
         duration = int(row.get("duration", 0) or 0)
@@ -59,44 +72,24 @@ def run_accuracy_test(knowledge_path: Path | None = None):
         if result is None:
             status = "MISS"
             missed += 1
-            results.append({
-                "track": track,
-                "status": status,
-                "expected_uri": expected_uri,
-                "got_uri": None,
-                "score": None,
-                "match_type": None,
-                "got_name": None,
-                "got_artist": None,
-            })
         elif result["uri"] == expected_uri:
             status = "OK"
             correct += 1
-            results.append({
-                "track": track,
-                "status": status,
-                "expected_uri": expected_uri,
-                "got_uri": result["uri"],
-                "score": result["score"],
-                "match_type": result.get("match_type"),
-                "got_name": result["name"],
-                "got_artist": result["artist"],
-                "got_duration_ms": result.get("duration_ms"),
-            })
         else:
             status = "WRONG"
             wrong += 1
-            results.append({
-                "track": track,
-                "status": status,
-                "expected_uri": expected_uri,
-                "got_uri": result["uri"],
-                "score": result["score"],
-                "match_type": result.get("match_type"),
-                "got_name": result["name"],
-                "got_artist": result["artist"],
-                "got_duration_ms": result.get("duration_ms"),
-            })
+        result = result or {}
+        results.append(AccuracyResult(
+            track=track,
+            status=status,
+            expected_uri=expected_uri,
+            got_uri=result.get("uri"),
+            score=result.get("score"),
+            match_type=result.get("match_type"),
+            got_name=result.get("name"),
+            got_artist=result.get("artist"),
+            got_duration_ms=result.get("duration_ms"),
+        ))
 
     # Print results
     print("=" * 80)
@@ -104,22 +97,21 @@ def run_accuracy_test(knowledge_path: Path | None = None):
     print("-" * 80)
 
     for r in results:
-        track = r["track"]
-        score_str = f"{r['score']:.0f}" if r["score"] is not None else "—"
-        type_str = r["match_type"] or "—"
-        print(f"{r['status']:<7} {score_str:>5} {type_str:<10} {track.artist} - {track.name}")
-        if r["status"] == "WRONG":
-            print(f"        Expected: {r['expected_uri']}")
-            print(f"        Got:      {r['got_uri']}")
-            print(f"                  {r['got_artist']} - {r['got_name']}")
-            if r.get("got_duration_ms"):
-                got_s = r["got_duration_ms"] / 1000
+        track = r.track
+        score_str = f"{r.score:.0f}" if r.score is not None else "—"
+        type_str = r.match_type or "—"
+        print(f"{r.status:<7} {score_str:>5} {type_str:<10} {track.artist} - {track.name}")
+        if r.status == "WRONG":
+            print(f"        Expected: {r.expected_uri}")
+            print(f"        Got:      {r.got_uri}")
+            print(f"                  {r.got_artist} - {r.got_name}")
+            if r.got_duration_ms:
+                got_s = r.got_duration_ms / 1000
                 print(f"                  Duration: {int(got_s//60)}:{int(got_s%60):02d}")
-            track = r["track"]
             if track.duration > 0:
                 print(f"        Rekordbox duration: {track.duration//60}:{track.duration%60:02d}")
-        if r["status"] == "MISS":
-            print(f"        Expected: {r['expected_uri']}")
+        if r.status == "MISS":
+            print(f"        Expected: {r.expected_uri}")
 
     # Summary
     total = len(regression_cases)
@@ -133,8 +125,10 @@ def run_accuracy_test(knowledge_path: Path | None = None):
     print("-" * 80)
     track_ids = [row["expected_uri"].split(":")[-1] for row in regression_cases]
     # Spotify API allows up to 50 tracks per call
-    tracks_info = sp.tracks(track_ids)
-    for i, item in enumerate(tracks_info["tracks"]):
+    tracks_info: list[dict | None] = []
+    for offset in range(0, len(track_ids), 50):
+        tracks_info.extend(sp.tracks(track_ids[offset:offset + 50])["tracks"])
+    for i, item in enumerate(tracks_info):
         if item:
             duration_s = item["duration_ms"] / 1000
             minutes = int(duration_s // 60)
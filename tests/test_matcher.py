@@ -1,5 +1,6 @@
 """Tests for djsupport.matcher — pure functions, no network calls."""
 
+from dataclasses import replace
 from unittest.mock import MagicMock
 
 import pytest
@@ -67,6 +68,11 @@ class TestNormalize:
         assert _normalize("Für") == "fur"
         assert _normalize("Âme") == "ame"
 
+    def test_folds_decomposed_accents_and_compatibility_forms(self):
+        assert _normalize("Cafe\u0301") == "cafe"
+        assert _normalize("\ufb01esta") == "fiesta"
+        assert _normalize("\uff26ox") == "fox"
+
     def test_removes_two_letter_country_tags(self):
         assert _normalize("Artist (UK)") == "artist"
 
@@ -91,6 +97,12 @@ class TestNormalize:
     def test_empty_string(self):
         assert _normalize("") == ""
 
+    def test_tag_removal_runs_before_separator_rewrite(self):
+        assert _normalize("Artist1 x[Label] Artist2") == "artist1, artist2"
+
+    def test_separator_rewrite_runs_before_feat_removal(self):
+        assert _normalize("Left ft x Right") == "left ft, right"
+
 
 class TestRepeatedParentheticalComparison:
     def test_collapses_immediately_adjacent_equivalent_groups_to_one_copy(self):
@@ -279,6 +291,37 @@ class TestScoreResult:
         result = make_result("Track", "Artist")
         assert _score_result(track, result) <= 100.0
 
+    def test_punctuation_only_differences_do_not_reduce_score(self):
+        track = make_track("Night-Drive", "Synthetic Artist, Other Artist")
+        result = make_result("Night Drive!", "Synthetic Artist & Other Artist")
+        components = _score_components(track, result)
+        assert components["raw_title_score"] == 100
+        assert components["stripped_title_score"] == 100
+
+    def test_initialisms_stay_single_tokens(self):
+        track = make_track("Night Drive", "A.K.A.")
+        result = make_result("Night Drive", "AKA")
+        assert _score_components(track, result)["artist_score"] == 100
+
+    def test_punctuation_only_artists_do_not_match_each_other(self):
+        track = make_track("Night Drive", "!!!")
+        result = make_result("Night Drive", "...")
+        assert _score_components(track, result)["artist_score"] == 0
+
+    def test_punctuation_only_titles_do_not_match_each_other(self):
+        track = make_track("...", "Synthetic Artist")
+        result = make_result("!!!", "Synthetic Artist")
+        components = _score_components(track, result)
+        assert components["raw_title_score"] == 0
+        assert components["stripped_title_score"] == 0
+
+    def test_contractions_stay_single_title_tokens(self):
+        track = make_track("Don't Stop", "Synthetic Artist")
+        result = make_result("Dont Stop", "Synthetic Artist")
+        components = _score_components(track, result)
+        assert components["raw_title_score"] == 100
+        assert components["stripped_title_score"] == 100
+
 
 class TestMatchTrack:
     def _mock_sp(self, items):
@@ -464,7 +507,7 @@ class TestMatchTrack:
     def test_recovers_existing_repeated_subtitle_candidate_without_new_search(self):
         source_title = "Signal (Sunrise Mix) (  sunrise   mix )"
         track = make_track(source_title, "Synthetic Artist")
-        original_track = Track(**vars(track))
+        original_track = replace(track)
         sp = self._mock_sp([
             make_spotify_item("Unrelated", "Other Artist", "spotify:track:other"),
             make_spotify_item(
@@ -603,6 +646,44 @@ class TestMatchTrack:
         # sp.search was called (multiple strategies may fire) — result should still be valid
         assert result["uri"] == "spotify:track:abc"
 
+    def test_scores_each_candidate_once_across_selection_passes(self, monkeypatch):
+        import djsupport.matcher as matcher
+
+        scored_uris: list[str] = []
+        score_components = matcher._score_components
+
+        def counting_score_components(track, result):
+            scored_uris.append(result["uri"])
+            return score_components(track, result)
+
+        monkeypatch.setattr(matcher, "_score_components", counting_score_components)
+        sp = self._mock_sp([
+            make_spotify_item("Night Drive (Synthetic Remix)", "Synthetic Artist", "uri:1"),
+        ])
+        track = make_track("Night Drive (Original Mix)", "Synthetic Artist")
+        match_track(sp, track, threshold=80)
+        assert sp.search.call_count > 1
+        assert scored_uris == ["uri:1"]
+
+    def test_alternatives_score_the_last_result_for_a_repeated_uri(self):
+        sp = MagicMock()
+        first = make_spotify_item("Night Drive", "Other Artist", "uri:repeated")
+        last = make_spotify_item(
+            "Night Drive (Synthetic Remix)", "Synthetic Artist", "uri:repeated",
+        )
+        sp.search.side_effect = [
+            {"tracks": {"items": [first]}},
+            {"tracks": {"items": [last]}},
+        ]
+        track = make_track("Night Drive (Original Mix)", "Synthetic Artist")
+
+        result = match_track_with_alternatives(sp, track, threshold=99)
+
+        [alternative] = result["alternatives"]
+        assert alternative["artist"] == "Synthetic Artist"
+        assert alternative["version"] == "synthetic remix"
+        assert "artist similarity 100" in alternative["score_reasons"]
+
     def test_remixer_triggers_additional_strategy(self):
         """When track has a remixer and Strategy 1 finds the exact remix, early exit fires."""
         sp = self._mock_sp([make_spotify_item("Sapphire (Joris Voorn Remix)", "Eagles & Butterflies", "uri:2")])
@@ -654,7 +735,7 @@ class TestTerminalAudioExtensionFallback:
         track = make_track(
             f"Signal (Original Mix){suffix}", "Known Artist", duration=360,
         )
-        original_track = Track(**vars(track))
+        original_track = replace(track)
         recovered = make_spotify_item(
             "Signal", "Known Artist", "spotify:track:signal", 360000,
         )
@@ -772,7 +853,7 @@ class TestTerminalAudioExtensionFallback:
         track = make_track(
             "Signal (Night Dub).aif", "Known Artist", duration=360,
         )
-        original_track = Track(**vars(track))
+        original_track = replace(track)
         wrong_version = make_spotify_item(
             "Signal.aif", "Known Artist", "spotify:track:wrong-version", 360000,
         )
@@ -153,6 +153,35 @@ class TestParseXml:
         assert "Folder A" in playlists[0].path
         assert "Subfolder B" in playlists[0].path
 
+    def test_streams_tracks_with_children_and_playlists_before_collection(
+        self, tmp_path,
+    ):
+        xml = tmp_path / "ordered.xml"
+        xml.write_text(textwrap.dedent("""\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <DJ_PLAYLISTS Version="1.0.0">
+                <PLAYLISTS>
+                    <NODE Type="0" Name="ROOT" Count="1">
+                        <NODE Type="1" Name="Early" KeyType="0" Entries="2">
+                            <TRACK Key="1"/>
+                            <TRACK Key="2"/>
+                        </NODE>
+                    </NODE>
+                </PLAYLISTS>
+                <COLLECTION Entries="2">
+                    <TRACK TrackID="1" Name="First" Artist="Artist" TotalTime="300">
+                        <TEMPO Inizio="0.0" Bpm="124.00" Metro="4/4" Battito="1"/>
+                        <POSITION_MARK Name="" Type="0" Start="0.1" Num="-1"/>
+                    </TRACK>
+                    <TRACK TrackID="2" Name="Second" Artist="Artist" TotalTime="240"/>
+                </COLLECTION>
+            </DJ_PLAYLISTS>
+        """))
+        tracks, playlists = parse_xml(xml)
+        assert [t.name for t in tracks.values()] == ["First", "Second"]
+        assert tracks["1"].duration == 300
+        assert [p.track_ids for p in playlists] == [["1", "2"]]
+
 
 class TestTrackDataclass:
     def test_display_format(self):
@@ -111,6 +111,12 @@ class TestSyncReport:
         r = _report(playlists=[pl1, pl2])
         assert r.total_unmatched == 3
 
+    def test_track_totals_counts_both_lists_in_one_pass(self):
+        pl1 = _playlist(matched=[_matched(), _matched(name="B")], unmatched=["X"])
+        pl2 = _playlist(unmatched=["Y", "Z"])
+        r = _report(playlists=[pl1, pl2])
+        assert r.track_totals() == (2, 3)
+
     def test_overall_match_rate_zero_when_empty(self):
         assert _report().overall_match_rate == 0.0
 
@@ -132,6 +138,15 @@ class TestSaveReport:
         save_report(r, path)
         assert (tmp_path / "report.md").exists()
 
+    def test_failed_save_keeps_previous_report(self, tmp_path):
+        report_path = tmp_path / "report.md"
+        report_path.write_text("previous report\n")
+        broken = _report(playlists=[_playlist(matched=[_matched(score=None)])])
+        with pytest.raises(TypeError):
+            save_report(broken, str(report_path))
+        assert report_path.read_text() == "previous report\n"
+        assert list(tmp_path.iterdir()) == [report_path]
+
     def test_file_contains_timestamp(self, tmp_path):
         path = str(tmp_path / "report.md")
         r = _report()
@@ -146,6 +161,18 @@ class TestSaveReport:
         content = (tmp_path / "report.md").read_text()
         assert "85" in content
 
+    def test_file_summarizes_scores_and_version_fallbacks(self, tmp_path):
+        path = str(tmp_path / "report.md")
+        pl = _playlist(matched=[
+            _matched(score=92.0),
+            _matched(score=80.0, match_type="fallback_version"),
+            _matched(score=98.0),
+        ])
+        save_report(_report(playlists=[pl]), path)
+        content = (tmp_path / "report.md").read_text()
+        assert "**Scores:** avg 90.0 | min 80.0 | max 98.0" in content
+        assert "**Version fallbacks:** 1" in content
+
     def test_file_contains_playlist_name(self, tmp_path):
         path = str(tmp_path / "report.md")
         pl = _playlist(name="Peak Time", path="My Playlists/Peak Time", matched=[_matched()])
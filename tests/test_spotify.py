@@ -5,12 +5,16 @@ from unittest.mock import MagicMock, patch
 import pytest
 import spotipy
 
+from djsupport import spotify
 from djsupport.spotify import (
     RateLimitError,
     SCOPES,
+    TokenBucket,
     _api_call_with_rate_limit,
     _parse_retry_after,
+    configure_rate_limit,
 )
+from djsupport.rekordbox import Track
 from djsupport.transfer import SpotifyMatcher, SpotifyItemKind
 
 
@@ -73,6 +77,29 @@ class TestApiCallWithRateLimit:
         assert exc_info.value.retry_after == 7200
         mock_sleep.assert_called_once_with(5)
 
+    @patch("djsupport.spotify.time.sleep")
+    def test_repeated_short_429s_back_off_exponentially(self, mock_sleep):
+        func = MagicMock(side_effect=[_make_429(1), _make_429(1), _make_429(1), "ok"])
+        result = _api_call_with_rate_limit(func)
+        assert result == "ok"
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2, 4]
+
+    @patch("djsupport.spotify.time.sleep")
+    def test_exhausted_short_retries_raise_rate_limit_error(self, mock_sleep):
+        func = MagicMock(side_effect=_make_429(1))
+        with pytest.raises(RateLimitError):
+            _api_call_with_rate_limit(func)
+        assert func.call_count == 4
+        assert mock_sleep.call_count == 3
+
+    @patch("djsupport.spotify.time.sleep")
+    def test_cumulative_wait_is_bounded(self, mock_sleep):
+        func = MagicMock(side_effect=[_make_429(40), _make_429(30), "ok"])
+        with pytest.raises(RateLimitError) as exc_info:
+            _api_call_with_rate_limit(func)
+        assert exc_info.value.retry_after == 30
+        mock_sleep.assert_called_once_with(40)
+
     @patch("djsupport.spotify.time.sleep")
     def test_retry_after_zero_floors_to_1s(self, mock_sleep):
         func = MagicMock(side_effect=[_make_429(0), "ok"])
@@ -113,6 +140,80 @@ class TestApiCallWithRateLimit:
         mock_sleep.assert_called_once_with(1)
 
 
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    def test_burst_up_to_capacity_does_not_sleep(self):
+        clock = FakeClock()
+        bucket = TokenBucket(3, 1.0, clock=clock, sleep=clock.sleep)
+        for _ in range(3):
+            bucket.acquire()
+        assert clock.sleeps == []
+
+    def test_empty_bucket_sleeps_until_next_token(self):
+        clock = FakeClock()
+        bucket = TokenBucket(2, 4.0, clock=clock, sleep=clock.sleep)
+        for _ in range(4):
+            bucket.acquire()
+        assert clock.sleeps == [0.25, 0.25]
+
+    def test_tokens_refill_over_time_up_to_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(2, 1.0, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 60
+        for _ in range(2):
+            bucket.acquire()
+        assert clock.sleeps == []
+
+    def test_drain_keeps_a_quarter_of_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(8, 1.0, clock=clock, sleep=clock.sleep)
+        bucket.drain()
+        for _ in range(3):
+            bucket.acquire()
+        assert clock.sleeps == [1.0]
+
+    @patch("djsupport.spotify.time.sleep")
+    def test_wrapped_calls_pass_through_limiter_and_drain_on_429(
+        self, mock_sleep, monkeypatch,
+    ):
+        clock = FakeClock()
+        bucket = TokenBucket(8, 1.0, clock=clock, sleep=clock.sleep)
+        monkeypatch.setattr(spotify, "_rate_limiter", bucket)
+        func = MagicMock(side_effect=[_make_429(1), "ok"])
+        assert _api_call_with_rate_limit(func) == "ok"
+        # The 429 drained the bucket to 2 tokens and the retry took one.
+        bucket.acquire()
+        assert clock.sleeps == []
+        bucket.acquire()
+        assert clock.sleeps == [1.0]
+
+    def test_configure_rate_limit_none_disables_pacing(self, monkeypatch):
+        monkeypatch.setattr(spotify, "_rate_limiter", TokenBucket(1, 1.0))
+        configure_rate_limit(None)
+        assert spotify._rate_limiter is None
+        configure_rate_limit(2.0)
+        assert spotify._rate_limiter.refill_rate == 2.0
+
+    @pytest.mark.parametrize("rate", [0, -1.0, float("nan"), float("inf")])
+    def test_configure_rate_limit_rejects_non_positive_rates(self, rate):
+        with pytest.raises(ValueError):
+            configure_rate_limit(rate)
+
+
 class TestParseRetryAfter:
     def test_numeric_value(self):
         exc = spotipy.SpotifyException(429, -1, "rate limited")
@@ -169,6 +270,52 @@ def test_spotify_adapter_uses_current_account_and_playlist_contracts():
     }, {})
 
 
+def test_spotify_adapter_asks_for_the_account_once():
+    client = MagicMock()
+    client.current_user.return_value = {"id": "stable-account"}
+    adapter = SpotifyMatcher(client)
+
+    assert [adapter.account_id() for _ in range(3)] == ["stable-account"] * 3
+    client.current_user.assert_called_once_with()
+
+
+def test_spotify_adapter_reuses_search_responses_across_tracks():
+    client = MagicMock()
+    client.search.return_value = {"tracks": {"items": [{
+        "uri": "spotify:track:one",
+        "name": "Lantern Song",
+        "artists": [{"name": "Invented Artist"}],
+        "album": {"name": "Invented Album"},
+        "duration_ms": 240000,
+    }]}}
+    adapter = SpotifyMatcher(client)
+    first = Track(
+        "1", "Lantern Song", "Invented Artist", "", "", "", "", "", 240,
+    )
+    second = Track(
+        "2", "Lantern Song", "Invented Artist", "", "", "", "", "", 240,
+    )
+
+    assert adapter.match(first, 80)["uri"] == "spotify:track:one"
+    assert adapter.match(second, 80)["uri"] == "spotify:track:one"
+    assert client.search.call_count == 1
+
+
+def test_spotify_adapter_retries_empty_search_responses():
+    client = MagicMock()
+    client.search.return_value = {"tracks": {"items": []}}
+    adapter = SpotifyMatcher(client)
+    track = Track(
+        "1", "Lantern Song", "Invented Artist", "", "", "", "", "", 240,
+    )
+
+    adapter.match(track, 80)
+    calls = client.search.call_count
+    adapter.match(track, 80)
+
+    assert client.search.call_count == 2 * calls
+
+
 def test_spotify_playlist_creation_propagates_transport_failure():
     client = spotipy.Spotify(auth="synthetic-token")
     error = _make_429(60)
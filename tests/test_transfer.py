@@ -3400,6 +3400,9 @@ class TestSpotifyApprovalAdapter:
         assert SpotifyMatcher(client).provisional_playlist_track_uris("snapshot-1") == [
             "spotify:track:one", "spotify:track:two",
         ]
+        client.playlist_items.assert_called_once_with(
+            "snapshot-1", fields="items(track(uri)),next",
+        )
 
     def test_missing_playlist_is_reported_without_hiding_other_errors(self):
         client = MagicMock()